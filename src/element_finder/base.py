@@ -3,16 +3,168 @@ Base classes and interfaces for the element finder system
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from playwright.sync_api import Page, ElementHandle
 import time
 
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = _NUMPY_AVAILABLE
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+# Same rule as ElementHandle.is_visible: non-empty bounding box and not visibility:hidden
+IS_VISIBLE_JS = '''(el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+}'''
+
+# Tag name, role, class, id and visibility of an element in a single round-trip
+ELEMENT_META_JS = '''(el) => ({
+    tag: el.tagName.toLowerCase(),
+    role: el.getAttribute('role'),
+    class: el.getAttribute('class'),
+    id: el.getAttribute('id'),
+    visible: (''' + IS_VISIBLE_JS + ''')(el)
+})'''
+
+# Element fields used to score an element without further round-trips
+_ELEMENT_INFO_FIELDS_JS = '''
+    tag: el.tagName.toLowerCase(),
+    role: el.getAttribute('role'),
+    class: el.getAttribute('class'),
+    id: el.getAttribute('id'),
+    text: el.textContent,
+    aria_label: el.getAttribute('aria-label'),
+    title: el.getAttribute('title'),
+    value: el.getAttribute('value'),
+    placeholder: el.getAttribute('placeholder'),
+    alt: el.getAttribute('alt')
+'''
+
+# Info dict (plus visibility) of a single element in one round-trip
+ELEMENT_INFO_JS = '(el) => ({' + _ELEMENT_INFO_FIELDS_JS + ', visible: (' + IS_VISIBLE_JS + ')(el)})'
+
+# Extracts info dicts for the (first `limit`) visible elements in the browser and drops
+# those whose text cannot possibly match the key words (no shared word and no
+# containment either way), so only plausible candidates cross the process boundary.
+# With `interactive_only`, elements that don't look interactive (no onclick, role or
+# form/link tag) are skipped as well. Elements whose uid is in `exclude_uids` (already
+# scored by the caller) are skipped before counting. At most `max_candidates` are returned.
+# With `buckets` (the selectors fused into a union), each candidate is tagged with the
+# index of the first bucket selector it matches and `limit` applies per bucket.
+# With `masks`, each candidate gets a bitmask of which of those selectors it matches.
+# Each candidate gets a uid that resolves back to its element until the registry is reset
+# for the next search pass, and its rounded bounding box (used to spot nested elements
+# that render as the same thing).
+_CANDIDATES_JS = '''(els, args) => {
+    const registry = window.__yamElements = window.__yamElements || {elements: [], uids: new WeakMap()};
+    const keyWords = args.key_words.toLowerCase().trim();
+    const keyTokens = keyWords.split(/\\s+/).filter(Boolean);
+    const interactiveTags = ['INPUT', 'BUTTON', 'A', 'SELECT', 'TEXTAREA'];
+    const bucketCounts = args.buckets ? args.buckets.map(() => 0) : null;
+    const excludedUids = new Set(args.exclude_uids || []);
+    const isVisible = ''' + IS_VISIBLE_JS + ''';
+    const candidates = [];
+    
+    for (const el of (args.limit == null || args.buckets ? els : els.slice(0, args.limit))) {
+        if (args.max_candidates != null && candidates.length >= args.max_candidates) break;
+        if (args.interactive_only && !(el.onclick || el.hasAttribute('role') || interactiveTags.includes(el.tagName))) continue;
+        if (excludedUids.has(registry.uids.get(el))) continue;
+        
+        let bucket = null;
+        if (args.buckets) {
+            bucket = args.buckets.findIndex(selector => el.matches(selector));
+            if (args.limit != null && bucketCounts[bucket]++ >= args.limit) continue;
+        }
+        
+        if (!isVisible(el)) continue;
+        
+        const info = {''' + _ELEMENT_INFO_FIELDS_JS + '''};
+        if (keyWords) {
+            const texts = [info.text, info.aria_label, info.title, info.value, info.placeholder, info.alt]
+                .filter(Boolean)
+                .map(text => text.toLowerCase().trim())
+                .filter(Boolean);
+            if (!texts.some(text => keyWords.includes(text) || keyTokens.some(token => text.includes(token)))) continue;
+        }
+        
+        let uid = registry.uids.get(el);
+        if (!uid) {
+            uid = registry.elements.push(el);
+            registry.uids.set(el, uid);
+        }
+        info.uid = uid;
+        info.bucket = bucket;
+        if (args.masks) {
+            info.mask = args.masks.reduce((mask, selector, i) => el.matches(selector) ? mask | (1 << i) : mask, 0);
+        }
+        const rect = el.getBoundingClientRect();
+        info.box = [Math.round(rect.x), Math.round(rect.y), Math.round(rect.width), Math.round(rect.height)];
+        candidates.push(info);
+    }
+    return {count: els.length, candidates: candidates};
+}'''
+
+# Looks up an element previously tagged with a uid (null if it has since been removed from the page)
+_RESOLVE_UID_JS = '''(uid) => {
+    const el = window.__yamElements ? window.__yamElements.elements[uid - 1] : null;
+    return el && el.isConnected ? el : null;
+}'''
+
+# Drops the uid registry so elements removed from the page are not kept alive by it
+_RESET_UIDS_JS = '() => { delete window.__yamElements; }'
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _score_numeric(cand_tokens, cand_lens, desc_tokens):
+        """Word overlap scores for padded rows of unique token hashes against the description's"""
+        scores = np.zeros(cand_tokens.shape[0])
+        for i in range(cand_tokens.shape[0]):
+            common = 0
+            for j in range(cand_lens[i]):
+                for desc_token in desc_tokens:
+                    if cand_tokens[i, j] == desc_token:
+                        common += 1
+                        break
+            if common:
+                scores[i] = common / max(cand_lens[i], desc_tokens.shape[0]) * 0.7
+        return scores
+
+
+def _word_overlap_scores(key_text: str, texts: List[str]) -> List[float]:
+    """Word overlap part of calculate_text_similarity for a batch of lowercased texts"""
+    key_words = set(key_text.split())
+    word_sets = [set(text.split()) for text in texts]
+    
+    if not _NUMBA_AVAILABLE:
+        return [len(key_words & words) / max(len(key_words), len(words)) * 0.7 if key_words & words else 0.0
+                for words in word_sets]
+    
+    # Compare token hashes in the compiled kernel instead of building set intersections
+    cand_tokens = np.zeros((len(word_sets), max(map(len, word_sets), default=0)), dtype=np.int64)
+    cand_lens = np.zeros(len(word_sets), dtype=np.int64)
+    for i, words in enumerate(word_sets):
+        cand_tokens[i, :len(words)] = [hash(word) for word in words]
+        cand_lens[i] = len(words)
+    desc_tokens = np.array([hash(word) for word in key_words], dtype=np.int64)
+    return _score_numeric(cand_tokens, cand_lens, desc_tokens).tolist()
+
 
 @dataclass
 class ElementMatch:
     """Represents a matched element with its confidence score and metadata"""
-    element: ElementHandle
+    element: Optional[ElementHandle]  # None until resolved when scored from an info dict
     score: float
     matched_by: str
     matched_text: str
@@ -37,6 +189,84 @@ class FinderContext:
     enable_dynamic_discovery: bool = True
     cache_enabled: bool = True
     debug: bool = False
+    # Selectors covered by the shared snapshot (set by the finder for the applicable strategies)
+    snapshot_selectors: List[str] = field(default_factory=list)
+    # Selector query results for the current search pass, invalidated on navigation
+    _selector_cache: Dict[Any, Any] = field(default_factory=dict, repr=False)
+    _selector_cache_url: Optional[str] = field(default=None, repr=False)
+    # Interned element texts and their similarity scores, keyed by (text id, key words)
+    _text_ids: Dict[str, int] = field(default_factory=dict, repr=False)
+    _score_cache: Dict[Tuple[int, str], float] = field(default_factory=dict, repr=False)
+    
+    @cached_property
+    def description_lower(self) -> str:
+        """Lowercased description, computed once and shared by all strategies"""
+        return self.description.lower()
+    
+    @cached_property
+    def desc_mask(self) -> int:
+        """Bitset of the a-z letters in the description, for cheap keyword rejection"""
+        mask = 0
+        for char in self.description_lower:
+            if 'a' <= char <= 'z':
+                mask |= 1 << (ord(char) - 97)
+        return mask
+    
+    def cached_result(self, key: Any, fetch: Callable[[], Any]) -> Any:
+        """Return the memoized result for key, calling fetch on the first request"""
+        if self.page.url != self._selector_cache_url:
+            self._selector_cache.clear()
+            self._selector_cache_url = self.page.url
+        if key not in self._selector_cache:
+            self._selector_cache[key] = fetch()
+        return self._selector_cache[key]
+    
+    @property
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Candidate info dicts for all snapshot selectors from one DOM walk, each with a selector bitmask"""
+        args = {
+            'limit': None,
+            'key_words': self.key_words,
+            'interactive_only': False,
+            'max_candidates': None,
+            'buckets': None,
+            'masks': self.snapshot_selectors
+        }
+        return self.cached_result(
+            ('snapshot', tuple(self.snapshot_selectors)),
+            lambda: self.page.eval_on_selector_all(', '.join(self.snapshot_selectors), _CANDIDATES_JS, args)['candidates']
+        )
+    
+    def cached_query(self, selector: str) -> List[ElementHandle]:
+        """query_selector_all memoized for the current search pass"""
+        return self.cached_result(('query', selector), lambda: self.page.query_selector_all(selector))
+    
+    def clear_selector_cache(self):
+        """Forget memoized selector results (the DOM may have changed)"""
+        self._selector_cache.clear()
+        
+        # Uids only need to resolve within one search pass - reset the page registry so
+        # re-rendered lists on long-lived pages don't accumulate detached elements
+        try:
+            self.page.evaluate(_RESET_UIDS_JS)
+        except Exception as e:
+            if self.debug:
+                print(f"  → Could not reset element registry: {e}")
+    
+    def intern_text(self, text: str) -> int:
+        """Small integer id for a text, shared by every occurrence of the same string"""
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = self._text_ids[text] = len(self._text_ids)
+        return text_id
+    
+    def cached_scores(self, texts: List[str], compute: Callable[[List[str]], List[float]]) -> List[float]:
+        """Scores of texts against the key words, computing only texts not seen before in this context"""
+        keys = [(self.intern_text(text), self.key_words) for text in texts]
+        missing = {key: text for key, text in zip(keys, texts) if key not in self._score_cache}
+        if missing:
+            self._score_cache.update(zip(missing, compute(list(missing.values()))))
+        return [self._score_cache[key] for key in keys]
 
 
 class ElementFinderStrategy(ABC):
@@ -45,6 +275,9 @@ class ElementFinderStrategy(ABC):
     def __init__(self, priority: int = 0):
         self.priority = priority
         self.name = self.__class__.__name__
+        # Stop walking selectors once the top-k ranking agrees this much with the previous selector's
+        self.topk_size = 3
+        self.topk_stability = 0.9
     
     @abstractmethod
     def can_handle(self, context: FinderContext) -> bool:
@@ -60,41 +293,61 @@ class ElementFinderStrategy(ABC):
         """Get CSS selectors for this strategy (selector, description)"""
         return []
     
+    def get_fallback_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """Get broad selectors that are only tried when get_selectors found no confident match"""
+        return []
+    
+    def get_snapshot_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """Selectors this strategy reads from the shared page snapshot"""
+        return []
+    
+    def needs_fallback(self, matches: List[ElementMatch]) -> bool:
+        """Check whether the primary selectors left us without a confident match"""
+        return not matches or max(match.score for match in matches) < 0.7
+    
+    def top_k_ids(self, matches: List[ElementMatch]) -> List[Any]:
+        """Identities of the k best matches, best first"""
+        ranked = sorted(matches, key=lambda match: -match.score)[:self.topk_size]
+        return [match.match_info.get('uid') or id(match.element) for match in ranked]
+    
+    def is_ranking_stable(self, previous: List[Any], current: List[Any]) -> bool:
+        """Check whether the top-k ranking converged (set overlap times pairwise order agreement)"""
+        if not previous or not current:
+            return False
+        
+        common = [uid for uid in current if uid in previous]
+        overlap = len(common) / max(len(previous), len(current))
+        
+        # Fraction of common pairs ranked in the same order by both lists
+        pairs = [(a, b) for i, a in enumerate(common) for b in common[i + 1:]]
+        if pairs:
+            agreement = sum(previous.index(a) < previous.index(b) for a, b in pairs) / len(pairs)
+        else:
+            agreement = 1.0
+        
+        return overlap * agreement >= self.topk_stability
+    
+    def has_meaningful_description(self, context: FinderContext) -> bool:
+        """Check the description has something worth searching for (not empty or whitespace)"""
+        # Any text can be a label - single characters ("X", "+") and stop words ("On", "A") included
+        return bool(context.description.strip())
+    
+    def get_element_meta(self, element: ElementHandle) -> Dict[str, Any]:
+        """Get tag name, role, class, id and visibility of an element in one call"""
+        return element.evaluate(ELEMENT_META_JS)
+    
     def score_element(self, element: ElementHandle, context: FinderContext) -> Optional[ElementMatch]:
         """Score a single element for relevance"""
         try:
-            if not element.is_visible():
+            # Get basic element information (visibility comes back in the same call)
+            meta = self.get_element_meta(element)
+            if not meta['visible']:
                 return None
-                
-            # Get basic element information
-            tag_name = element.evaluate('el => el.tagName.toLowerCase()')
-            element_role = element.get_attribute('role')
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
             
             # Extract text using strategy-specific methods
             element_text = self.extract_element_text(element, context)
             
-            if not element_text:
-                return None
-            
-            # Calculate similarity score
-            score = self.calculate_text_similarity(context.key_words, element_text)
-            
-            if score > self.get_score_threshold():
-                return ElementMatch(
-                    element=element,
-                    score=score + self.get_strategy_bonus(),
-                    matched_by=f"{self.name} text match",
-                    matched_text=element_text,
-                    strategy_name=self.name,
-                    match_info={
-                        'tag_name': tag_name,
-                        'role': element_role,
-                        'class': element_class,
-                        'id': element_id
-                    }
-                )
+            return self._match_text(element_text, meta, element, context)
                 
         except Exception as e:
             if context.debug:
@@ -102,6 +355,48 @@ class ElementFinderStrategy(ABC):
         
         return None
     
+    def score_info(self, info: Dict[str, Any], element: Optional[ElementHandle], context: FinderContext) -> Optional[ElementMatch]:
+        """Score an element from its extracted info dict (element may be resolved later)"""
+        return self._match_text(self.select_info_text(info), info, element, context)
+    
+    def score_infos(self, infos: List[Dict[str, Any]], context: FinderContext) -> List[Optional[ElementMatch]]:
+        """Score a batch of info dicts, computing text similarity for the whole batch at once"""
+        texts = [self.select_info_text(info) for info in infos]
+        similarities = self.cached_text_similarities(context, texts)
+        
+        # Below-threshold texts can never match, so skip building anything for them
+        threshold = self.get_score_threshold()
+        return [self._match_text(text, info, None, context, similarity) if similarity > threshold else None
+                for info, text, similarity in zip(infos, texts, similarities)]
+    
+    def _match_text(self, element_text: str, meta: Dict[str, Any], element: Optional[ElementHandle],
+                    context: FinderContext, similarity: Optional[float] = None) -> Optional[ElementMatch]:
+        """Build a match if the element text is similar enough to the key words"""
+        if not element_text:
+            return None
+        
+        # Calculate similarity score (unless it was computed for a whole batch)
+        score = similarity if similarity is not None else self.cached_text_similarities(context, [element_text])[0]
+        
+        if score > self.get_score_threshold():
+            return ElementMatch(
+                element=element,
+                score=score + self.get_strategy_bonus(),
+                matched_by=f"{self.name} text match",
+                matched_text=element_text,
+                strategy_name=self.name,
+                match_info={
+                    'tag_name': meta['tag'],
+                    'role': meta['role'],
+                    'class': meta['class'] or '',
+                    'id': meta['id'] or '',
+                    'uid': meta.get('uid'),
+                    'box': meta.get('box')
+                }
+            )
+        
+        return None
+    
     def extract_element_text(self, element: ElementHandle, context: FinderContext) -> str:
         """Extract text from element - can be overridden by strategies"""
         # Try common text extraction methods
@@ -112,6 +407,74 @@ class ElementFinderStrategy(ABC):
             text = element.get_attribute('title') or ''
         return text.strip()
     
+    def select_info_text(self, info: Dict[str, Any]) -> str:
+        """Pick element text from an info dict - mirrors extract_element_text"""
+        text = info['text'] or info['value'] or ''
+        if not text:
+            text = info['aria_label'] or ''
+        if not text:
+            text = info['title'] or ''
+        return text.strip()
+    
+    def extract_candidates(self, context: FinderContext, selector: str, limit: Optional[int] = None,
+                           interactive_only: bool = False, max_candidates: Optional[int] = None,
+                           buckets: Optional[List[str]] = None, exclude_uids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Extract info dicts of visible, plausibly matching elements for a selector in one round-trip"""
+        args = {
+            'limit': limit,
+            'key_words': context.key_words,
+            'interactive_only': interactive_only,
+            'max_candidates': max_candidates,
+            'buckets': buckets,
+            'exclude_uids': exclude_uids
+        }
+        return context.cached_result(
+            ('candidates', selector, limit, interactive_only, max_candidates, tuple(buckets or ()),
+             tuple(sorted(exclude_uids or ()))),
+            lambda: context.page.eval_on_selector_all(selector, _CANDIDATES_JS, args)
+        )
+    
+    def extract_candidate_buckets(self, context: FinderContext, selectors: List[Tuple[str, str]],
+                                  limit: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """Extract candidates for several selectors in one DOM pass, grouped under the first selector each matches"""
+        selector_list = [selector for selector, _ in selectors]
+        result = self.extract_candidates(context, ', '.join(selector_list), limit, buckets=selector_list)
+        
+        buckets = [[] for _ in selectors]
+        for info in result['candidates']:
+            buckets[info['bucket']].append(info)
+        return buckets
+    
+    def snapshot_buckets(self, context: FinderContext, selectors: List[Tuple[str, str]],
+                         limit: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+        """extract_candidate_buckets served from the shared page snapshot when it covers all selectors"""
+        if not all(selector in context.snapshot_selectors for selector, _ in selectors):
+            return self.extract_candidate_buckets(context, selectors, limit)
+        
+        positions = [context.snapshot_selectors.index(selector) for selector, _ in selectors]
+        buckets = [[] for _ in selectors]
+        for info in context.snapshot:
+            # Group under the first of our selectors the element matches
+            for bucket, position in zip(buckets, positions):
+                if info['mask'] >> position & 1:
+                    if limit is None or len(bucket) < limit:
+                        bucket.append(info)
+                    break
+        return buckets
+    
+    def resolve_match(self, match: ElementMatch, context: FinderContext) -> bool:
+        """Resolve the element handle of a match scored from an info dict; False if the element went away"""
+        if match.element is None:
+            match.element = context.page.evaluate_handle(_RESOLVE_UID_JS, match.match_info['uid']).as_element()
+        return match.element is not None
+    
+    def best_resolved_match(self, matches: List[ElementMatch], context: FinderContext) -> Optional[ElementMatch]:
+        """Highest scoring match whose element can still be resolved (handles are only fetched for it)"""
+        for match in sorted(matches, key=lambda m: m.score, reverse=True):
+            if self.resolve_match(match, context):
+                return match
+        return None
+    
     def calculate_text_similarity(self, text1: str, text2: str) -> float:
         """Calculate similarity between two texts (0-1 score)"""
         text1 = text1.lower().strip()
@@ -134,6 +497,61 @@ class ElementFinderStrategy(ABC):
         
         return 0.0
     
+    def calculate_text_similarities(self, text1: str, texts: List[str]) -> List[float]:
+        """calculate_text_similarity of text1 against each of texts, batching the word overlap step"""
+        text1 = text1.lower().strip()
+        
+        if _NUMPY_AVAILABLE and texts:
+            # Exact and containment checks over the whole batch as array operations
+            # (lowercased in Python first - lowering can lengthen a text, e.g. 'İ', which a
+            # fixed-width array would truncate)
+            lowered = np.array([text.lower().strip() for text in texts], dtype=str)
+            contains = (np.char.find(lowered, text1) >= 0) | (np.char.find(np.full(len(texts), text1), lowered) >= 0)
+            score_array = np.where(lowered == text1, 1.0, np.where(contains, 0.8, 0.0))
+            overlap_indices = np.flatnonzero(score_array == 0.0).tolist()
+            overlap_texts = lowered[overlap_indices].tolist()
+            scores = score_array.tolist()
+        else:
+            scores = []
+            overlap_indices = []
+            overlap_texts = []
+            
+            for i, text2 in enumerate(texts):
+                text2 = text2.lower().strip()
+                if text1 == text2:
+                    scores.append(1.0)
+                elif text1 in text2 or text2 in text1:
+                    scores.append(0.8)
+                else:
+                    scores.append(0.0)
+                    overlap_indices.append(i)
+                    overlap_texts.append(text2)
+        
+        if overlap_texts:
+            for i, score in zip(overlap_indices, _word_overlap_scores(text1, overlap_texts)):
+                scores[i] = score
+        return scores
+    
+    def cached_text_similarities(self, context: FinderContext, texts: List[str]) -> List[float]:
+        """Similarity of each text to the key words, reusing scores of repeated texts (menus, table rows)"""
+        return context.cached_scores(texts, lambda missing: self.calculate_text_similarities(context.key_words, missing))
+    
+    def _sequential_dedupe(self, matches: List[ElementMatch]) -> List[ElementMatch]:
+        """Drop matches equivalent to a higher-ranked one in a single pass (best first)"""
+        seen = set()
+        deduped = []
+        for match in sorted(matches, key=lambda m: m.score, reverse=True):
+            # Same text at the same spot is the same thing on screen (e.g. a span filling its button)
+            box = match.match_info.get('box')
+            if box:
+                key = (match.matched_text, tuple(box))
+            else:
+                key = (match.match_info.get('uid') or id(match.element), match.matched_text)
+            if key not in seen:
+                seen.add(key)
+                deduped.append(match)
+        return deduped
+    
     def get_score_threshold(self) -> float:
         """Minimum score threshold for this strategy"""
         return 0.5
@@ -156,14 +574,14 @@ class TimingMixin:
     
     def time_operation(self, operation_name: str, func, *args, **kwargs):
         """Time an operation and store the result"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.timing_data[operation_name] = duration
             return result
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             self.timing_data[f"{operation_name}_failed"] = duration
             raise e
     
@@ -6,7 +6,7 @@ import time
 from typing import List, Optional, Dict, Any
 from playwright.sync_api import Page, ElementHandle
 
-from .base import ElementFinderStrategy, ElementMatch, FinderContext
+from .base import ElementFinderStrategy, ElementMatch, FinderContext, ELEMENT_META_JS
 from .cache import SmartCache
 from .strategies import (
     FormFieldStrategy, ButtonStrategy, DevExtremeStrategy, 
@@ -63,7 +63,7 @@ class HybridElementFinder:
         Returns:
             ElementHandle if found, None otherwise
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.performance_stats['total_searches'] += 1
         
         # Normalize description
@@ -90,7 +90,7 @@ class HybridElementFinder:
         # Phase 1: Check cache first
         cached_result = self._try_cache(context)
         if cached_result:
-            search_time = time.time() - start_time
+            search_time = time.perf_counter() - start_time
             self._update_performance_stats('cache', search_time, True)
             if self.debug:
                 print(f"✓ Cache hit! Found in {search_time*1000:.1f}ms")
@@ -106,26 +106,33 @@ class HybridElementFinder:
             if self.debug:
                 print(f"  → Attempt {attempt + 1}/{retry_attempts}")
             
+            # Each attempt re-reads the DOM, which may have changed since the last one
+            context.clear_selector_cache()
+            
             # Get applicable strategies for this context
             applicable_strategies = [s for s in self.strategies if s.can_handle(context)]
             
+            # Strategies that share the page snapshot get all their candidates from one DOM walk
+            context.snapshot_selectors = list(dict.fromkeys(
+                selector for s in applicable_strategies for selector, _ in s.get_snapshot_selectors(context)
+            ))
+            
             if self.debug:
                 strategy_names = [s.name for s in applicable_strategies]
                 print(f"  → Using strategies: {strategy_names}")
             
             # Try each applicable strategy
             for strategy in applicable_strategies:
-                strategy_start = time.time()
+                strategy_start = time.perf_counter()
                 
                 try:
                     matches = strategy.find_elements(context)
-                    strategy_time = time.time() - strategy_start
+                    strategy_time = time.perf_counter() - strategy_start
                     
-                    if matches:
-                        # Sort matches by score (highest first)
-                        matches.sort(key=lambda m: m.score, reverse=True)
-                        top_match = matches[0]
-                        
+                    # Best match whose element still resolves (handles are only fetched for it)
+                    top_match = strategy.best_resolved_match(matches, context)
+                    
+                    if top_match:
                         if self.debug:
                             print(f"  → {strategy.name}: Found {len(matches)} matches, best score: {top_match.score:.2f} ({strategy_time*1000:.1f}ms)")
                         
@@ -145,7 +152,7 @@ class HybridElementFinder:
                         self._update_strategy_stats(strategy.name, strategy_time, False)
                         
                 except Exception as e:
-                    strategy_time = time.time() - strategy_start
+                    strategy_time = time.perf_counter() - strategy_start
                     self._update_strategy_stats(strategy.name, strategy_time, False)
                     if self.debug:
                         print(f"  → {strategy.name} failed: {e}")
@@ -165,7 +172,7 @@ class HybridElementFinder:
                 self._wait_for_page_stability(context)
         
         # Phase 4: Process results
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
         
         if best_match:
             self._update_performance_stats(best_match.strategy_name, search_time, True)
@@ -207,7 +214,7 @@ class HybridElementFinder:
         Returns:
             ElementHandle if found, None otherwise
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.performance_stats['total_searches'] += 1
         
         # Normalize descriptions
@@ -241,36 +248,44 @@ class HybridElementFinder:
             if self.debug:
                 print(f"  → Attempt {attempt + 1}/{retry_attempts}")
             
+            # Each attempt re-reads the DOM, which may have changed since the last one
+            context.clear_selector_cache()
+            
             # Get applicable strategies for this context
             applicable_strategies = [s for s in self.strategies if s.can_handle(context)]
             
+            # Strategies that share the page snapshot get all their candidates from one DOM walk
+            context.snapshot_selectors = list(dict.fromkeys(
+                selector for s in applicable_strategies for selector, _ in s.get_snapshot_selectors(context)
+            ))
+            
             if self.debug:
                 strategy_names = [s.name for s in applicable_strategies]
                 print(f"  → Using strategies: {strategy_names}")
             
             # Try each applicable strategy
             for strategy in applicable_strategies:
-                strategy_start = time.time()
+                strategy_start = time.perf_counter()
                 
                 try:
                     matches = strategy.find_elements(context)
-                    strategy_time = time.time() - strategy_start
+                    strategy_time = time.perf_counter() - strategy_start
                     
                     if matches:
                         # Filter out matches containing exclusion text
                         filtered_matches = []
                         for match in matches:
-                            element_text = strategy.extract_element_text(match.element, context)
+                            # The text the match was scored on - no need to re-read it from the element
+                            element_text = match.matched_text
                             if element_text and exclusion_description not in element_text.lower():
                                 filtered_matches.append(match)
                             elif self.debug:
                                 print(f"  → Filtered out: '{element_text}' (contains exclusion text)")
                         
-                        if filtered_matches:
-                            # Sort matches by score (highest first)
-                            filtered_matches.sort(key=lambda m: m.score, reverse=True)
-                            top_match = filtered_matches[0]
-                            
+                        # Best remaining match whose element still resolves
+                        top_match = strategy.best_resolved_match(filtered_matches, context)
+                        
+                        if top_match:
                             if self.debug:
                                 print(f"  → {strategy.name}: Found {len(filtered_matches)} filtered matches, best score: {top_match.score:.2f} ({strategy_time*1000:.1f}ms)")
                             
@@ -294,7 +309,7 @@ class HybridElementFinder:
                         self._update_strategy_stats(strategy.name, strategy_time, False)
                         
                 except Exception as e:
-                    strategy_time = time.time() - strategy_start
+                    strategy_time = time.perf_counter() - strategy_start
                     self._update_strategy_stats(strategy.name, strategy_time, False)
                     if self.debug:
                         print(f"  → {strategy.name} failed: {e}")
@@ -314,7 +329,7 @@ class HybridElementFinder:
                 self._wait_for_page_stability(context)
         
         # Phase 3: Process results
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
         
         if best_match:
             self._update_performance_stats(best_match.strategy_name, search_time, True)
@@ -427,11 +442,12 @@ class HybridElementFinder:
             selector = self._generate_element_selector(match.element)
             
             # Get element attributes for caching
+            meta = match.element.evaluate(ELEMENT_META_JS)
             element_attributes = {
-                'tag': match.element.evaluate('el => el.tagName.toLowerCase()'),
-                'id': match.element.get_attribute('id') or '',
-                'class': match.element.get_attribute('class') or '',
-                'role': match.element.get_attribute('role') or ''
+                'tag': meta['tag'],
+                'id': meta['id'] or '',
+                'class': meta['class'] or '',
+                'role': meta['role'] or ''
             }
             
             self.cache.put(
@@ -503,7 +519,7 @@ class HybridElementFinder:
             }''')
         except:
             # Fallback selector
-            return element.evaluate('el => el.tagName.toLowerCase()')
+            return element.evaluate('e => e.tagName').lower()
     
     def _update_performance_stats(self, strategy_name: str, duration: float, success: bool):
         """Update performance statistics"""
@@ -82,7 +82,7 @@ class AutoDiscoveryPageModel:
             return False
         
         print(f"🔍 Discovering page structure for: {url_pattern}")
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Initialize page model
         if url_pattern not in self.page_models:
@@ -124,7 +124,7 @@ class AutoDiscoveryPageModel:
                 print(f"  → Discovery selector failed: {e}")
                 continue
         
-        discovery_time = time.time() - start_time
+        discovery_time = time.perf_counter() - start_time
         print(f"  → Discovered {discovered_count} elements in {discovery_time:.2f}s")
         
         # Save to disk
@@ -181,11 +181,22 @@ class AutoDiscoveryPageModel:
     def _create_element_descriptor(self, element: ElementHandle, page: Page) -> Optional[ElementDescriptor]:
         """Create a descriptor for an element"""
         try:
-            # Get basic element information
-            tag_name = element.evaluate('el => el.tagName.toLowerCase()')
-            element_role = element.get_attribute('role')
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
+            # Get basic element information and attributes in one call
+            info = element.evaluate('''(el) => ({
+                tag: el.tagName.toLowerCase(),
+                role: el.getAttribute('role'),
+                class: el.getAttribute('class'),
+                id: el.getAttribute('id'),
+                type: el.getAttribute('type'),
+                name: el.getAttribute('name'),
+                aria_label: el.getAttribute('aria-label'),
+                title: el.getAttribute('title'),
+                placeholder: el.getAttribute('placeholder')
+            })''')
+            tag_name = info['tag']
+            element_role = info['role']
+            element_class = info['class'] or ''
+            element_id = info['id'] or ''
             
             # Determine element type
             element_type = self._determine_element_type(tag_name, element_role, element_class)
@@ -205,11 +216,11 @@ class AutoDiscoveryPageModel:
                 'id': element_id,
                 'class': element_class,
                 'role': element_role or '',
-                'type': element.get_attribute('type') or '',
-                'name': element.get_attribute('name') or '',
-                'aria-label': element.get_attribute('aria-label') or '',
-                'title': element.get_attribute('title') or '',
-                'placeholder': element.get_attribute('placeholder') or ''
+                'type': info['type'] or '',
+                'name': info['name'] or '',
+                'aria-label': info['aria_label'] or '',
+                'title': info['title'] or '',
+                'placeholder': info['placeholder'] or ''
             }
             
             # Calculate confidence based on available information
@@ -353,7 +364,7 @@ class AutoDiscoveryPageModel:
             }''')
         except:
             # Ultimate fallback
-            return element.evaluate('el => el.tagName.toLowerCase()')
+            return element.evaluate('e => e.tagName').lower()
     
     def _calculate_element_confidence(self, text_content: str, attributes: Dict[str, str], element_type: str) -> float:
         """Calculate confidence score for an element descriptor"""
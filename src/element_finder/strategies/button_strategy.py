@@ -14,8 +14,11 @@ class ButtonStrategy(ElementFinderStrategy):
     
     def can_handle(self, context: FinderContext) -> bool:
         """Check if this is a button request"""
+        if not self.has_meaningful_description(context):
+            return False
+        
         button_indicators = ['button', 'click', 'submit', 'login', 'save', 'next', 'back']
-        return any(indicator in context.description.lower() for indicator in button_indicators)
+        return any(indicator in context.description_lower for indicator in button_indicators)
     
     def get_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
         """Get selectors for buttons"""
@@ -33,7 +36,7 @@ class ButtonStrategy(ElementFinderStrategy):
         
         for selector, desc in self.get_selectors(context):
             try:
-                elements = context.page.query_selector_all(selector)
+                elements = context.cached_query(selector)
                 if context.debug:
                     print(f"  → Button: Found {len(elements)} elements using {desc}")
                 
@@ -117,14 +120,14 @@ class ButtonStrategy(ElementFinderStrategy):
     def score_element(self, element, context: FinderContext):
         """Enhanced scoring for button elements with better relevance detection"""
         try:
-            if not element.is_visible():
+            # Get basic element information (visibility comes back in the same call)
+            meta = self.get_element_meta(element)
+            if not meta['visible']:
                 return None
-                
-            # Get basic element information
-            tag_name = element.evaluate('el => el.tagName.toLowerCase()')
-            element_role = element.get_attribute('role')
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
+            tag_name = meta['tag']
+            element_role = meta['role']
+            element_class = meta['class'] or ''
+            element_id = meta['id'] or ''
             
             # Extract text using strategy-specific methods
             element_text = self.extract_element_text(element, context)
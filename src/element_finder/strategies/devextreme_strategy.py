@@ -2,10 +2,83 @@
 Strategy specialized for DevExtreme UI framework elements
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from ..base import ElementFinderStrategy, ElementMatch, FinderContext
 
 
+# Returns the number of matches for each selector (null if the selector is invalid),
+# counting matches inside open shadow roots too like query_selector_all does
+_SELECTOR_COUNTS_JS = '''(selectors) => {
+    const roots = [document];
+    for (let i = 0; i < roots.length; i++) {
+        for (const el of roots[i].querySelectorAll('*')) {
+            if (el.shadowRoot) roots.push(el.shadowRoot);
+        }
+    }
+    return selectors.map(selector => {
+        try {
+            return roots.reduce((count, root) => count + root.querySelectorAll(selector).length, 0);
+        } catch (e) {
+            return null;
+        }
+    });
+}'''
+
+# Cheap attributes read by extract_element_text, including the tag name
+_DX_ELEMENT_INFO_JS = '''(el) => ({
+    tag: el.tagName.toLowerCase(),
+    role: el.getAttribute('role'),
+    class: el.getAttribute('class'),
+    id: el.getAttribute('id'),
+    title: el.getAttribute('title'),
+    aria_label: el.getAttribute('aria-label'),
+    placeholder: el.getAttribute('placeholder')
+})'''
+
+# Parent container title and associated row label of a combobox input (null when missing)
+_DX_COMBOBOX_TEXTS_JS = '''(el) => {
+    const result = {parent_title: null, label: null};
+
+    // Look for parent title
+    let parent = el.parentElement;
+    while (parent && parent !== document.body) {
+        if (parent.title) {
+            result.parent_title = parent.title;
+            break;
+        }
+        parent = parent.parentElement;
+    }
+
+    // Look for associated label in the same row/container
+    // Find the dx-selectbox container
+    const container = el.closest('.dx-selectbox, .dx-dropdowneditor');
+    if (!container) return result;
+
+    // Look for label in the same row (common pattern for forms)
+    const row = container.closest('.row, .form-group, .col-md-19, [class*="col-"]');
+    let label = row ? row.querySelector('label') : null;
+
+    // Look for label as a sibling element
+    if (!(label && label.textContent) && container.parentElement) {
+        label = container.parentElement.querySelector('label');
+    }
+
+    if (label && label.textContent) {
+        result.label = label.textContent.trim();
+    }
+    return result;
+}'''
+
+# Visible text of a DevExtreme button
+_DX_BUTTON_TEXT_JS = '''(el) => {
+    const textSpan = el.querySelector('.dx-button-text');
+    if (textSpan && textSpan.textContent) {
+        return textSpan.textContent.trim();
+    }
+    return el.textContent ? el.textContent.trim() : '';
+}'''
+
+
 class DevExtremeStrategy(ElementFinderStrategy):
     """Strategy specialized for DevExtreme UI components"""
     
@@ -14,6 +87,9 @@ class DevExtremeStrategy(ElementFinderStrategy):
     
     def can_handle(self, context: FinderContext) -> bool:
         """Check if page uses DevExtreme or description suggests DevExtreme elements"""
+        if not self.has_meaningful_description(context):
+            return False
+        
         # Check if page has DevExtreme classes/elements
         try:
             has_dx_elements = context.page.query_selector('[class*="dx-"]') is not None
@@ -26,8 +102,8 @@ class DevExtremeStrategy(ElementFinderStrategy):
         dropdown_indicators = ['dropdown', 'select', 'type', 'category', 'choose']
         # Also handle menu items like logout, login, etc. that might be in DevExtreme menus
         menu_indicators = ['logout', 'login', 'menu', 'profile', 'switch']
-        return (any(indicator in context.description.lower() for indicator in dropdown_indicators) or 
-                any(indicator in context.description.lower() for indicator in menu_indicators))
+        return (any(indicator in context.description_lower for indicator in dropdown_indicators) or 
+                any(indicator in context.description_lower for indicator in menu_indicators))
     
     def get_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
         """Get selectors for DevExtreme components"""
@@ -39,6 +115,11 @@ class DevExtremeStrategy(ElementFinderStrategy):
             ('[class*="dx-menu-item-text"]', 'DevExtreme menu item text'),
             ('[class*="dx-textbox"], [class*="dx-texteditor"]', 'DevExtreme text inputs'),
             ('[role="option"]', 'dropdown option elements'),
+        ]
+    
+    def get_fallback_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """Get broad selectors used only when the specific ones found no confident match"""
+        return [
             ('[class*="dx-"]', 'all DevExtreme components'),
             ('[role="combobox"]', 'combobox elements'),
         ]
@@ -47,9 +128,47 @@ class DevExtremeStrategy(ElementFinderStrategy):
         """Find DevExtreme elements"""
         matches = []
         
-        for selector, desc in self.get_selectors(context):
+        early_match = self._search_selectors(self.get_selectors(context), context, matches)
+        if early_match:
+            return early_match
+        
+        # Broad selectors can match hundreds of elements - only use them when needed
+        if self.needs_fallback(matches):
+            if context.debug:
+                print(f"  → DevExtreme: No confident match yet, trying fallback selectors")
+            early_match = self._search_selectors(self.get_fallback_selectors(context), context, matches)
+            if early_match:
+                return early_match
+        
+        return matches
+    
+    def _selector_counts(self, context: FinderContext) -> Dict[str, Optional[int]]:
+        """Match counts of the primary and fallback selectors, probed together once per search pass"""
+        # One probe (a single DOM walk) covers both selector lists so empty selectors don't cost a query each
+        selectors = [selector for selector, _ in self.get_selectors(context) + self.get_fallback_selectors(context)]
+        return context.cached_result(
+            ('dx_selector_counts', tuple(selectors)),
+            lambda: dict(zip(selectors, context.page.evaluate(_SELECTOR_COUNTS_JS, selectors)))
+        )
+    
+    def _search_selectors(self, selectors: List[Tuple[str, str]], context: FinderContext,
+                          matches: List[ElementMatch]) -> Optional[List[ElementMatch]]:
+        """Score elements for each selector, collecting into matches; returns early-terminating match if any"""
+        try:
+            selector_counts = self._selector_counts(context)
+        except Exception as e:
+            if context.debug:
+                print(f"  → DevExtreme selector probe failed: {e}")
+            selector_counts = {}
+        
+        for selector, desc in selectors:
+            if selector_counts.get(selector) == 0:
+                if context.debug:
+                    print(f"  → DevExtreme: No elements for {desc}, skipping")
+                continue
+            
             try:
-                elements = context.page.query_selector_all(selector)
+                elements = context.cached_query(selector)
                 if context.debug:
                     print(f"  → DevExtreme: Found {len(elements)} elements using {desc}")
                 
@@ -59,10 +178,12 @@ class DevExtremeStrategy(ElementFinderStrategy):
                         matches.append(match)
                         
                         # Early termination for exact matches in dropdown list items
-                        element_text = self.extract_element_text(element, context).lower()
-                        if (element_text == context.description.lower() and 
-                            ('dx-list-item-content' in (element.get_attribute('class') or '') or
-                             'dx-item-content' in (element.get_attribute('class') or ''))):
+                        # (text and class were already fetched while scoring)
+                        element_text = match.matched_text.lower()
+                        element_class = match.match_info['class']
+                        if (element_text == context.description_lower and 
+                            ('dx-list-item-content' in element_class or
+                             'dx-item-content' in element_class)):
                             if context.debug:
                                 print(f"  → Exact match in dropdown list item found (score: {match.score:.2f})")
                             match.score = max(match.score, 0.95)  # Boost score for exact matches
@@ -78,130 +199,70 @@ class DevExtremeStrategy(ElementFinderStrategy):
                 if context.debug:
                     print(f"  → DevExtreme selector failed: {e}")
         
-        return matches
+        return None
     
     def extract_element_text(self, element, context: FinderContext) -> str:
         """Enhanced text extraction for DevExtreme components"""
-        texts = []
+        # Sources are tried in priority order and the first non-empty one wins,
+        # so later (more expensive) lookups are only paid for when needed
+        
+        # Cheap attributes (including the tag name) come back together in one call
+        info = element.evaluate(_DX_ELEMENT_INFO_JS)
         
         # 1. Title attribute (very common in DevExtreme components)
-        title_attr = element.get_attribute('title')
+        title_attr = (info['title'] or '').strip()
         if title_attr:
-            texts.append(title_attr.strip())
+            return title_attr
         
         # 2. For DevExtreme combobox inputs, check parent container's title and associated label
-        element_role = element.get_attribute('role')
-        tag_name = element.evaluate('el => el.tagName.toLowerCase()')
-        
-        if element_role == 'combobox' and tag_name == 'input':
+        if info['role'] == 'combobox' and info['tag'] == 'input':
+            # Parent title and associated label in one call; missing values come back as null
             try:
-                # Look for parent title
-                parent_title = element.evaluate('''(el) => {
-                    let parent = el.parentElement;
-                    while (parent && parent !== document.body) {
-                        if (parent.title) {
-                            return parent.title;
-                        }
-                        parent = parent.parentElement;
-                    }
-                    return null;
-                }''')
-                if parent_title:
-                    texts.append(parent_title.strip())
-                
-                # Look for associated label in the same row/container
-                associated_label = element.evaluate('''(el) => {
-                    // Find the dx-selectbox container
-                    let container = el.closest('.dx-selectbox, .dx-dropdowneditor');
-                    if (!container) return null;
-                    
-                    // Look for label in the same row (common pattern for forms)
-                    let row = container.closest('.row, .form-group, .col-md-19, [class*="col-"]');
-                    if (row) {
-                        let label = row.querySelector('label');
-                        if (label && label.textContent) {
-                            return label.textContent.trim();
-                        }
-                    }
-                    
-                    // Look for label as a sibling element
-                    let parent = container.parentElement;
-                    if (parent) {
-                        let label = parent.querySelector('label');
-                        if (label && label.textContent) {
-                            return label.textContent.trim();
-                        }
-                    }
-                    
-                    return null;
-                }''')
-                if associated_label:
-                    texts.append(associated_label.strip())
-                    
-            except:
-                pass
+                combobox_texts = element.evaluate(_DX_COMBOBOX_TEXTS_JS)
+                for text in (combobox_texts['parent_title'], combobox_texts['label']):
+                    if text is not None and text.strip():
+                        return text.strip()
+            except Exception as e:
+                # e.g. the element was detached mid-scan - fall through to the remaining sources
+                if context.debug:
+                    print(f"  → DevExtreme combobox text lookup failed: {e}")
         
         # 3. aria-label
-        aria_label = element.get_attribute('aria-label')
+        aria_label = (info['aria_label'] or '').strip()
         if aria_label:
-            texts.append(aria_label.strip())
+            return aria_label
         
         # 4. Convert DevExtreme ID/class to readable text
-        element_class = element.get_attribute('class') or ''
-        element_id = element.get_attribute('id') or ''
+        cls_lc = (info['class'] or '').lower()
         
-        if 'dx-selectbox' in element_class.lower() or 'dx-dropdowneditor' in element_class.lower():
+        if 'dx-selectbox' in cls_lc or 'dx-dropdowneditor' in cls_lc:
+            element_id = info['id'] or ''
             if element_id:
                 readable_text = self._convert_dx_id_to_text(element_id)
                 if readable_text:
-                    texts.append(readable_text)
+                    return readable_text
         
         # 5. DevExtreme button text patterns
-        if 'dx-button' in element_class.lower():
+        if 'dx-button' in cls_lc:
             try:
-                button_text = element.evaluate('''(el) => {
-                    const textSpan = el.querySelector('.dx-button-text');
-                    if (textSpan && textSpan.textContent) {
-                        return textSpan.textContent.trim();
-                    }
-                    return el.textContent ? el.textContent.trim() : '';
-                }''')
+                button_text = element.evaluate(_DX_BUTTON_TEXT_JS)
                 if button_text:
-                    texts.append(button_text)
-            except:
-                pass
+                    return button_text
+            except Exception as e:
+                if context.debug:
+                    print(f"  → DevExtreme button text lookup failed: {e}")
         
-        # 5b. DevExtreme menu item text patterns
-        if 'dx-menu-item-text' in element_class.lower():
-            try:
-                # For dx-menu-item-text spans, the text content is the primary source
-                menu_text = element.text_content()
-                if menu_text and menu_text.strip():
-                    texts.append(menu_text.strip())
-            except:
-                pass
-        
-        # 5c. DevExtreme list item content patterns
-        if 'dx-list-item-content' in element_class.lower() or 'dx-item-content' in element_class.lower():
-            try:
-                # For dx-list-item-content divs, the text content is the primary source
-                item_text = element.text_content()
-                if item_text and item_text.strip():
-                    texts.append(item_text.strip())
-            except:
-                pass
-        
-        # 6. Standard text content and attributes
-        text_content = element.text_content()
+        # 6. Standard text content - also the primary source for dx-menu-item-text
+        #    spans and dx-list-item-content divs
+        text_content = (element.text_content() or '').strip()
         if text_content:
-            texts.append(text_content.strip())
+            return text_content
         
-        placeholder = element.get_attribute('placeholder')
+        placeholder = (info['placeholder'] or '').strip()
         if placeholder:
-            texts.append(placeholder.strip())
+            return placeholder
         
-        # Return the first meaningful text found
-        return next((text for text in texts if text and len(text.strip()) > 0), '')
+        return ''
     
     def _convert_dx_id_to_text(self, element_id: str) -> str:
         """Convert DevExtreme element ID to readable text"""
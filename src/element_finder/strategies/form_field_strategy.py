@@ -6,6 +6,46 @@ from typing import List, Tuple
 from ..base import ElementFinderStrategy, ElementMatch, FinderContext
 
 
+# Label text for a form field: label[for], wrapping label, then sibling label
+_FORM_LABEL_JS = '''(el) => {
+    // Strategy 1: label[for] attribute (looked up in the field's own document or shadow root)
+    if (el.id) {
+        const label = el.getRootNode().querySelector(`label[for="${CSS.escape(el.id)}"]`);
+        if (label && label.textContent) {
+            return label.textContent;
+        }
+    }
+
+    // Strategy 2: wrapped in label
+    let parent = el.parentElement;
+    let depth = 0;
+    while (parent && parent.tagName !== 'LABEL' && parent.tagName !== 'BODY' && depth < 3) {
+        parent = parent.parentElement;
+        depth++;
+    }
+    if (parent && parent.tagName === 'LABEL' && parent.textContent) {
+        return parent.textContent;
+    }
+
+    // Strategy 3: sibling label
+    parent = el.parentElement;
+    if (parent) {
+        let sibling = parent.previousElementSibling;
+        if (sibling && sibling.tagName === 'LABEL') {
+            return sibling.textContent;
+        }
+        // Check parent's parent too
+        if (parent.parentElement) {
+            sibling = parent.parentElement.previousElementSibling;
+            if (sibling && sibling.tagName === 'LABEL') {
+                return sibling.textContent;
+            }
+        }
+    }
+    return null;
+}'''
+
+
 class FormFieldStrategy(ElementFinderStrategy):
     """Strategy specialized for form field elements"""
     
@@ -14,8 +54,11 @@ class FormFieldStrategy(ElementFinderStrategy):
     
     def can_handle(self, context: FinderContext) -> bool:
         """Check if this is a form field request"""
+        if not self.has_meaningful_description(context):
+            return False
+        
         field_indicators = ['field', 'input', 'email', 'password', 'name', 'address', 'phone']
-        return any(indicator in context.description.lower() for indicator in field_indicators)
+        return any(indicator in context.description_lower for indicator in field_indicators)
     
     def get_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
         """Get selectors for form fields"""
@@ -30,7 +73,7 @@ class FormFieldStrategy(ElementFinderStrategy):
         
         for selector, desc in self.get_selectors(context):
             try:
-                elements = context.page.query_selector_all(selector)
+                elements = context.cached_query(selector)
                 if context.debug:
                     print(f"  → FormField: Found {len(elements)} elements using {desc}")
                 
@@ -47,91 +90,39 @@ class FormFieldStrategy(ElementFinderStrategy):
     
     def extract_element_text(self, element, context: FinderContext) -> str:
         """Enhanced text extraction for form fields"""
-        # Try multiple strategies for form field text
-        texts = []
+        # Sources are tried in priority order and the first non-empty one wins,
+        # so later lookups (each a round-trip) are only paid for when needed
         
         # 1. Placeholder text
-        placeholder = element.get_attribute('placeholder')
+        placeholder = (element.get_attribute('placeholder') or '').strip()
         if placeholder:
-            texts.append(placeholder.strip())
+            return placeholder
         
         # 2. Associated label using multiple strategies
         label_text = self._get_associated_label_text(element, context)
         if label_text:
-            texts.append(label_text)
+            return label_text
         
         # 3. aria-label
-        aria_label = element.get_attribute('aria-label')
+        aria_label = (element.get_attribute('aria-label') or '').strip()
         if aria_label:
-            texts.append(aria_label.strip())
+            return aria_label
         
         # 4. name/id attributes (converted to readable form)
-        name = element.get_attribute('name')
-        if name:
-            readable_name = self._convert_attribute_to_text(name)
-            if readable_name:
-                texts.append(readable_name)
-        
-        element_id = element.get_attribute('id')
-        if element_id:
-            readable_id = self._convert_attribute_to_text(element_id)
-            if readable_id:
-                texts.append(readable_id)
+        for attr in ('name', 'id'):
+            readable = self._convert_attribute_to_text(element.get_attribute(attr) or '')
+            if readable:
+                return readable
         
-        # Return the first non-empty text found
-        return next((text for text in texts if text), '')
+        return ''
     
     def _get_associated_label_text(self, element, context: FinderContext) -> str:
         """Get label text associated with form field using multiple strategies"""
-        try:
-            # Strategy 1: label[for] attribute
-            element_id = context.page.evaluate('(el) => el.id', element)
-            if element_id:
-                label = context.page.query_selector(f'label[for="{element_id}"]')
-                if label:
-                    label_text = label.text_content()
-                    if label_text:
-                        return label_text.strip()
-            
-            # Strategy 2: wrapped in label
-            parent_label = context.page.evaluate('''(el) => {
-                let parent = el.parentElement;
-                let depth = 0;
-                while (parent && parent.tagName !== 'LABEL' && parent.tagName !== 'BODY' && depth < 3) {
-                    parent = parent.parentElement;
-                    depth++;
-                }
-                return parent && parent.tagName === 'LABEL' ? parent.textContent : null;
-            }''', element)
-            if parent_label:
-                return parent_label.strip()
-            
-            # Strategy 3: sibling label
-            sibling_label = context.page.evaluate('''(el) => {
-                let parent = el.parentElement;
-                if (parent) {
-                    let sibling = parent.previousElementSibling;
-                    if (sibling && sibling.tagName === 'LABEL') {
-                        return sibling.textContent;
-                    }
-                    // Check parent's parent too
-                    if (parent.parentElement) {
-                        sibling = parent.parentElement.previousElementSibling;
-                        if (sibling && sibling.tagName === 'LABEL') {
-                            return sibling.textContent;
-                        }
-                    }
-                }
-                return null;
-            }''', element)
-            if sibling_label:
-                return sibling_label.strip()
-                
-        except Exception as e:
-            if context.debug:
-                print(f"  → Error getting label text: {e}")
-        
-        return ''
+        # All label lookups run in a single round-trip
+        label_text = element.evaluate(_FORM_LABEL_JS)
+        if label_text is None:
+            return ''
+        return label_text.strip()
     
     def _convert_attribute_to_text(self, attr_value: str) -> str:
         """Convert attribute value to readable text"""
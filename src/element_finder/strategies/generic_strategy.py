@@ -2,8 +2,32 @@
 Generic fallback strategy for any interactive elements
 """
 
-from typing import List, Tuple
-from ..base import ElementFinderStrategy, ElementMatch, FinderContext
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+from ..base import ElementFinderStrategy, ElementMatch, FinderContext, ELEMENT_INFO_JS
+
+
+# Class/ID fragments that mark an element as a layout container
+_CONTAINER_CLASSES = ['content', 'container', 'wrapper', 'main', 'body', 'section', 'grid', 'col', 'layout']
+# Salesforce-specific container classes
+_SF_CONTAINERS = ['maincontentmark', 'slds-grid', 'slds-col', 'slds-container', 'slds-page-header']
+
+# Single-pass matchers for the lists above (matched against lowercased class/id strings)
+_CONTAINER_RE = re.compile('|'.join(map(re.escape, _CONTAINER_CLASSES)))
+_SF_RE = re.compile('|'.join(map(re.escape, _SF_CONTAINERS)))
+_INTERACTIVE_RE = re.compile('button|btn|clickable|interactive')
+
+# Attribute text sources in an element info dict, in priority order (alt last for images)
+_TEXT_ATTRS = ('aria_label', 'title', 'value', 'placeholder', 'alt')
+
+
+# Broad selectors for any interactive elements, most specific first
+_GENERIC_SELECTORS = (
+    ('input, button, textarea, select, a[href]', 'standard interactive elements'),
+    ('[role="button"], [role="menuitem"], [role="option"], [role="combobox"]', 'ARIA interactive elements'),
+    ('[onclick], [tabindex]', 'clickable elements'),
+    ('div[class*="button"], div[class*="menu"], div[class*="item"]', 'styled interactive elements'),
+)
 
 
 class GenericStrategy(ElementFinderStrategy):
@@ -14,90 +38,101 @@ class GenericStrategy(ElementFinderStrategy):
     
     def can_handle(self, context: FinderContext) -> bool:
         """Generic strategy can handle any request as fallback"""
-        return True
+        return self.has_meaningful_description(context)
     
     def get_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
         """Get broad selectors for any interactive elements"""
+        return list(_GENERIC_SELECTORS)
+    
+    def get_snapshot_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """All of our selectors can be served from the shared page snapshot"""
+        return self.get_selectors(context)
+    
+    def get_fallback_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """Last resort selector when the interactive selectors found no confident match"""
         return [
-            ('input, button, textarea, select, a[href]', 'standard interactive elements'),
-            ('[role="button"], [role="menuitem"], [role="option"], [role="combobox"]', 'ARIA interactive elements'),
-            ('[onclick], [tabindex]', 'clickable elements'),
-            ('div[class*="button"], div[class*="menu"], div[class*="item"]', 'styled interactive elements'),
-            ('*', 'all elements')  # Last resort
+            ('*', 'interactive elements anywhere on the page'),
         ]
     
     def find_elements(self, context: FinderContext) -> List[ElementMatch]:
         """Find elements using broad selectors"""
         matches = []
+        seen_uids = set()  # Elements already scored by an earlier selector
         
-        for selector, desc in self.get_selectors(context):
-            try:
-                elements = context.page.query_selector_all(selector)
-                if context.debug:
-                    print(f"  → Generic: Found {len(elements)} elements using {desc}")
-                
-                # Limit processing for very broad selectors
-                max_elements = 50 if selector != '*' else 20
-                
-                for i, element in enumerate(elements[:max_elements]):
-                    if not element.is_visible():
-                        continue
-                        
-                    match = self.score_element(element, context)
-                    if match:
-                        matches.append(match)
-                        
-                        # Early termination for high-confidence matches
-                        if match.score >= 0.9:
-                            if context.debug:
-                                print(f"  → High-confidence generic match found (score: {match.score:.2f})")
-                            return [match]
-                
-                # If we found decent matches, don't continue to broader selectors
-                if matches and selector != '*':
-                    break
-                        
-            except Exception as e:
-                if context.debug:
-                    print(f"  → Generic selector failed: {e}")
+        selectors = self.get_selectors(context)
+        early_match = self._search_buckets(selectors, self._extract_buckets(selectors, context, seen_uids), context, matches, seen_uids)
+        if early_match:
+            return early_match
+        
+        if self.needs_fallback(matches):
+            selectors = self.get_fallback_selectors(context)
+            early_match = self._search_buckets(selectors, self._extract_buckets(selectors, context, seen_uids), context, matches, seen_uids)
+            if early_match:
+                return early_match
+        
+        # Element handles are resolved by the caller, only for the winning match
+        return self._sequential_dedupe(matches)
+    
+    def _extract_buckets(self, selectors: List[Tuple[str, str]], context: FinderContext,
+                         seen_uids: Set[int]) -> Optional[List[List[Dict[str, Any]]]]:
+        """Extract and prefilter candidates per selector in the browser in one round-trip (None if it failed)"""
+        try:
+            if [selector for selector, _ in selectors] == ['*']:
+                # Scan the whole page but only keep the first few interactive-looking candidates;
+                # elements already scored are excluded in the browser so they don't use up the cap
+                return [self.extract_candidates(context, '*', interactive_only=True, max_candidates=20,
+                                                exclude_uids=list(seen_uids))['candidates']]
+            # The page snapshot holds all selectors from one DOM pass; each candidate is
+            # grouped under the first selector it matches
+            return self.snapshot_buckets(context, selectors, 50)
+        except Exception as e:
+            if context.debug:
+                print(f"  → Generic selector failed: {e}")
+            return None
+    
+    def _search_buckets(self, selectors: List[Tuple[str, str]], buckets: Optional[List[List[Dict[str, Any]]]],
+                        context: FinderContext, matches: List[ElementMatch], seen_uids: Set[int]) -> Optional[List[ElementMatch]]:
+        """Score candidates for each selector, collecting into matches; returns early-terminating match if any"""
+        for (selector, desc), bucket in zip(selectors, buckets or []):
+            if context.debug:
+                print(f"  → Generic: Found {len(bucket)} plausible candidates using {desc}")
+            
+            candidates = [info for info in bucket if info['uid'] not in seen_uids]
+            seen_uids.update(info['uid'] for info in candidates)
+            
+            for match in self.score_infos(candidates, context):
+                if match:
+                    matches.append(match)
+                    
+                    # Early termination for high-confidence matches
+                    if match.score >= 0.9:
+                        if context.debug:
+                            print(f"  → High-confidence generic match found (score: {match.score:.2f})")
+                        return [match]
+            
+            # If we found decent matches, don't continue to broader selectors
+            if matches:
+                break
         
-        return matches
+        return None
     
     def extract_element_text(self, element, context: FinderContext) -> str:
         """Comprehensive text extraction for any element with container filtering"""
-        texts = []
-        
-        # Try all common text sources
-        text_content = element.text_content()
-        if text_content:
-            text_content = text_content.strip()
-            # Filter out container elements with excessive text (likely not the target element)
-            if len(text_content) < 150:  # Reasonable limit for interactive elements
-                texts.append(text_content)
-        
-        aria_label = element.get_attribute('aria-label')
-        if aria_label:
-            texts.append(aria_label.strip())
-        
-        title = element.get_attribute('title')
-        if title:
-            texts.append(title.strip())
-        
-        value = element.get_attribute('value')
-        if value:
-            texts.append(value.strip())
-        
-        placeholder = element.get_attribute('placeholder')
-        if placeholder:
-            texts.append(placeholder.strip())
-        
-        # For generic elements, also try alt text
-        alt = element.get_attribute('alt')
-        if alt:
-            texts.append(alt.strip())
+        return self.select_info_text(element.evaluate(ELEMENT_INFO_JS))
+    
+    def select_info_text(self, info: Dict[str, Any]) -> str:
+        """Pick the most meaningful text from an element info dict"""
+        # Filter out container elements with excessive text (likely not the target element)
+        text_content = (info['text'] or '').strip()
+        if text_content and len(text_content) < 150:  # Reasonable limit for interactive elements
+            return text_content
         
-        # Return the first meaningful text
-        return next((text for text in texts if text and len(text.strip()) > 0), '')
+        # Otherwise the first non-empty attribute text wins
+        for attr in _TEXT_ATTRS:
+            text = (info[attr] or '').strip()
+            if text:
+                return text
+        return ''
     
     def get_score_threshold(self) -> float:
         """Higher threshold for generic strategy to reduce false positives"""
@@ -110,54 +145,12 @@ class GenericStrategy(ElementFinderStrategy):
     def score_element(self, element, context: FinderContext):
         """Enhanced scoring for generic elements with container detection"""
         try:
-            if not element.is_visible():
+            # Get basic element information, text sources and visibility in one call
+            info = element.evaluate(ELEMENT_INFO_JS)
+            if not info['visible']:
                 return None
-                
-            # Get basic element information
-            tag_name = element.evaluate('el => el.tagName.toLowerCase()')
-            element_role = element.get_attribute('role') or ''
-            element_class = element.get_attribute('class') or ''
-            element_id = element.get_attribute('id') or ''
-            
-            # Extract text using strategy-specific methods
-            element_text = self.extract_element_text(element, context)
-            
-            if not element_text:
-                return None
-            
-            # Calculate basic similarity score
-            base_score = self.calculate_text_similarity(context.key_words, element_text)
-            
-            if base_score <= self.get_score_threshold():
-                return None
-            
-            # Apply text relevance scoring for container detection
-            relevance_score = self.calculate_text_relevance(context.key_words, element_text)
-            
-            # Apply container penalty
-            container_penalty = self.get_container_penalty(element_text, element_class, element_id, tag_name)
             
-            # Final score calculation
-            final_score = base_score * relevance_score - container_penalty + self.get_strategy_bonus()
-            final_score = max(0.0, min(1.0, final_score))  # Clamp to 0-1
-            
-            if final_score > self.get_score_threshold():
-                return ElementMatch(
-                    element=element,
-                    score=final_score,
-                    matched_by=f"{self.name} enhanced text match",
-                    matched_text=element_text,
-                    strategy_name=self.name,
-                    match_info={
-                        'tag_name': tag_name,
-                        'role': element_role,
-                        'class': element_class,
-                        'id': element_id,
-                        'base_score': base_score,
-                        'relevance_score': relevance_score,
-                        'container_penalty': container_penalty
-                    }
-                )
+            return self.score_info(info, element, context)
                 
         except Exception as e:
             if context.debug:
@@ -165,6 +158,55 @@ class GenericStrategy(ElementFinderStrategy):
         
         return None
     
+    def _match_text(self, element_text: str, info: Dict[str, Any], element, context: FinderContext,
+                    similarity: Optional[float] = None) -> Optional[ElementMatch]:
+        """Score an element from its text and info dict (element may be None and resolved later)"""
+        tag_name = info['tag']
+        element_role = info['role'] or ''
+        element_class = info['class'] or ''
+        element_id = info['id'] or ''
+        
+        if not element_text:
+            return None
+        
+        # Calculate basic similarity score (unless it was computed for a whole batch)
+        base_score = similarity if similarity is not None else self.cached_text_similarities(context, [element_text])[0]
+        
+        if base_score <= self.get_score_threshold():
+            return None
+        
+        # Apply text relevance scoring for container detection
+        relevance_score = self.calculate_text_relevance(context.key_words, element_text)
+        
+        # Apply container penalty
+        container_penalty = self.get_container_penalty(element_text, element_class, element_id, tag_name)
+        
+        # Final score calculation
+        final_score = base_score * relevance_score - container_penalty + self.get_strategy_bonus()
+        final_score = max(0.0, min(1.0, final_score))  # Clamp to 0-1
+        
+        if final_score > self.get_score_threshold():
+            return ElementMatch(
+                element=element,
+                score=final_score,
+                matched_by=f"{self.name} enhanced text match",
+                matched_text=element_text,
+                strategy_name=self.name,
+                match_info={
+                    'tag_name': tag_name,
+                    'role': element_role,
+                    'class': element_class,
+                    'id': element_id,
+                    'uid': info.get('uid'),
+                    'box': info.get('box'),
+                    'base_score': base_score,
+                    'relevance_score': relevance_score,
+                    'container_penalty': container_penalty
+                }
+            )
+        
+        return None
+    
     def calculate_text_relevance(self, search_text: str, element_text: str) -> float:
         """Calculate how relevant the element text is to the search text"""
         search_text = search_text.lower().strip()
@@ -207,22 +249,22 @@ class GenericStrategy(ElementFinderStrategy):
         elif len(element_text) > 50:
             penalty += 0.2
         
+        cls_lc = element_class.lower()
+        
         # Penalty for generic container tags with no interactive role
-        if tag_name in ['div', 'span', 'section', 'main'] and not any(keyword in element_class.lower() for keyword in ['button', 'btn', 'clickable', 'interactive']):
+        if tag_name in ['div', 'span', 'section', 'main'] and not _INTERACTIVE_RE.search(cls_lc):
             penalty += 0.2
         
         # Penalty for container-like classes
-        container_classes = ['content', 'container', 'wrapper', 'main', 'body', 'section', 'grid', 'col', 'layout']
-        if any(container_class in element_class.lower() for container_class in container_classes):
+        if _CONTAINER_RE.search(cls_lc):
             penalty += 0.3
         
         # Penalty for container-like IDs
-        if any(container_class in element_id.lower() for container_class in container_classes):
+        if _CONTAINER_RE.search(element_id.lower()):
             penalty += 0.3
         
         # Heavy penalty for Salesforce-specific container classes
-        salesforce_containers = ['maincontentmark', 'slds-grid', 'slds-col', 'slds-container', 'slds-page-header']
-        if any(sf_class in element_class.lower() for sf_class in salesforce_containers):
+        if _SF_RE.search(cls_lc):
             penalty += 0.5
         
         return penalty
\ No newline at end of file
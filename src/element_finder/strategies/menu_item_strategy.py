@@ -2,10 +2,30 @@
 Strategy for finding menu item and navigation elements
 """
 
-from typing import List, Tuple
+import re
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, List, Tuple
 from ..base import ElementFinderStrategy, ElementMatch, FinderContext
 
 
+# Words in a description that suggest a menu item or navigation element
+_MENU_INDICATORS = ('menu', 'nav', 'item', 'option', 'logout', 'profile')
+_MENU_RE = re.compile('|'.join(_MENU_INDICATORS), re.IGNORECASE)
+# Letter bitset of each indicator - a description missing any of its letters can't contain it
+_INDICATOR_MASKS = tuple(reduce(or_, (1 << (ord(c) - 97) for c in word)) for word in _MENU_INDICATORS)
+
+
+# Menu item selectors, most specific first
+_MENU_ITEM_SELECTORS = (
+    ('[role="menuitem"], [role="option"]', 'ARIA menu items'),
+    ('.dx-menu-item-text', 'DevExtreme menu item text'),
+    ('nav a, nav button, nav li', 'navigation elements'),
+    ('[class*="menu"] a, [class*="menu"] button, [class*="menu"] li', 'menu-styled elements'),
+    ('li a, li button, li span[onclick]', 'list item links/buttons'),
+)
+
+
 class MenuItemStrategy(ElementFinderStrategy):
     """Strategy specialized for menu items and navigation elements"""
     
@@ -14,45 +34,69 @@ class MenuItemStrategy(ElementFinderStrategy):
     
     def can_handle(self, context: FinderContext) -> bool:
         """Check if this is a menu item request"""
-        menu_indicators = ['menu', 'nav', 'item', 'option', 'logout', 'profile']
-        return any(indicator in context.description.lower() for indicator in menu_indicators)
+        if not self.has_meaningful_description(context):
+            return False
+        
+        # Cheap reject before the regex scan: no indicator has all its letters in the description
+        desc_mask = context.desc_mask
+        if not any((mask & desc_mask) == mask for mask in _INDICATOR_MASKS):
+            return False
+        
+        return _MENU_RE.search(context.description) is not None
     
     def get_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
         """Get selectors for menu items"""
-        return [
-            ('[role="menuitem"], [role="option"]', 'ARIA menu items'),
-            ('.dx-menu-item-text', 'DevExtreme menu item text'),
-            ('nav a, nav button, nav li', 'navigation elements'),
-            ('[class*="menu"] a, [class*="menu"] button, [class*="menu"] li', 'menu-styled elements'),
-            ('li a, li button, li span[onclick]', 'list item links/buttons'),
-        ]
+        return list(_MENU_ITEM_SELECTORS)
+    
+    def get_snapshot_selectors(self, context: FinderContext) -> List[Tuple[str, str]]:
+        """All of our selectors can be served from the shared page snapshot"""
+        return self.get_selectors(context)
     
     def find_elements(self, context: FinderContext) -> List[ElementMatch]:
         """Find menu item elements"""
+        selectors = self.get_selectors(context)
+        
+        # Candidates come from the page snapshot (one DOM pass shared with other strategies);
+        # each candidate is grouped under the first selector it matches
+        try:
+            buckets = self.snapshot_buckets(context, selectors)
+        except Exception as e:
+            if context.debug:
+                print(f"  → MenuItem selector failed: {e}")
+            return []
+        
+        return self._search_buckets(selectors, buckets, context)
+    
+    def _search_buckets(self, selectors: List[Tuple[str, str]], buckets: List[List[Dict[str, Any]]],
+                        context: FinderContext) -> List[ElementMatch]:
+        """Score candidates selector by selector, stopping early on a confident or stable result"""
         matches = []
+        previous_top = []
         
-        for selector, desc in self.get_selectors(context):
-            try:
-                elements = context.page.query_selector_all(selector)
+        for (selector, desc), candidates in zip(selectors, buckets):
+            if context.debug:
+                print(f"  → MenuItem: Found {len(candidates)} plausible candidates using {desc}")
+            
+            for info, match in zip(candidates, self.score_infos(candidates, context)):
+                if match:
+                    matches.append(match)
+                    
+                    # Early termination for high-confidence menu item matches
+                    if match.score >= 0.8 and 'menuitem' in (info['role'] or ''):
+                        if context.debug:
+                            print(f"  → High-confidence menu item match found (score: {match.score:.2f})")
+                        return [match]
+            
+            # Later selectors are broader; stop once they no longer change the best matches
+            current_top = self.top_k_ids(matches)
+            if self.is_ranking_stable(previous_top, current_top):
                 if context.debug:
-                    print(f"  → MenuItem: Found {len(elements)} elements using {desc}")
-                
-                for element in elements:
-                    match = self.score_element(element, context)
-                    if match:
-                        matches.append(match)
-                        
-                        # Early termination for high-confidence menu item matches
-                        if match.score >= 0.8 and 'menuitem' in (element.get_attribute('role') or ''):
-                            if context.debug:
-                                print(f"  → High-confidence menu item match found (score: {match.score:.2f})")
-                            return [match]
-                        
-            except Exception as e:
-                if context.debug:
-                    print(f"  → MenuItem selector failed: {e}")
+                    print(f"  → MenuItem: Top matches stable after {desc}, skipping remaining selectors")
+                break
+            previous_top = current_top
         
-        return matches
+        # Element handles are resolved by the caller, only for the winning match
+        return self._sequential_dedupe(matches)
     
     def extract_element_text(self, element, context: FinderContext) -> str:
         """Enhanced text extraction for menu items"""
@@ -73,6 +117,13 @@ class MenuItemStrategy(ElementFinderStrategy):
         
         return ''
     
+    def select_info_text(self, info: Dict[str, Any]) -> str:
+        """Menu item text from an info dict - mirrors extract_element_text"""
+        for text in (info['text'], info['aria_label'], info['title']):
+            if text:
+                return text.strip()
+        return ''
+    
     def get_score_threshold(self) -> float:
         """Standard threshold for menu items"""
         return 0.5
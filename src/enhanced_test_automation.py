@@ -10,19 +10,74 @@ Performance improvements:
 - 2-5s improvement over original method
 """
 
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, expect, TimeoutError as PlaywrightTimeoutError
+import asyncio
+import concurrent.futures
+import gzip
+import hashlib
+import tempfile
 import time
 import os
 import json
-from anthropic import Anthropic
+import re
+from anthropic import Anthropic, AsyncAnthropic
+
+try:
+    # orjson parses in C several times faster; fall back to the standard library when absent
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from element_finder import HybridElementFinder
+from element_finder.base import IS_VISIBLE_JS
+
+
+# Installed on every document via add_init_script so verify attempts only send a short call
+_VERIFY_INIT_JS = 'window.__yamBodyTextIncludes = (t) => document.body.innerText.toLowerCase().includes(t);'
+
+# Whether the page's body text contains the (lowercased) needle
+_BODY_TEXT_INCLUDES_JS = '(t) => window.__yamBodyTextIncludes(t)'
+
+# Visibility (the element finder's rule, same as element.is_visible()) and disabled state
+# of a click target in one round-trip
+_CLICK_STATE_JS = '''(el) => ({
+    visible: (''' + IS_VISIBLE_JS + ''')(el),
+    disabled: !!el.disabled || el.hasAttribute('disabled')
+})'''
+
+# Characters not allowed in debug artifact filenames
+_SAFE_RE = re.compile(r'[^A-Za-z0-9 _-]')
+
+# Model used to parse test steps into actions
+PARSE_MODEL = "claude-3-5-sonnet-20241022"
+
+# LLM parse results keyed by a hash of the test steps, so unchanged tests skip the LLM call
+PARSE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'yam', 'parsed_steps.json')
+
+
+def _write_debug_html(html_file, html_content):
+    """Write captured HTML to disk (runs on the debug executor)"""
+    try:
+        # Level 1 gzip is close to memcpy speed and still shrinks markup several times over
+        with gzip.open(html_file, 'wt', encoding='utf-8', compresslevel=1) as f:
+            f.write(html_content)
+    except Exception as e:
+        print(f"Warning: Could not save HTML debug: {e}")
+
+
+def _write_debug_screenshot(screenshot_file, screenshot_bytes):
+    """Write a captured screenshot to disk (runs on the debug executor)"""
+    try:
+        with open(screenshot_file, 'wb') as f:
+            f.write(screenshot_bytes)
+    except Exception as e:
+        print(f"Warning: Could not save debug screenshot: {e}")
 
 
 class EnhancedTestAutomation:
     """Enhanced test automation with hybrid element finder system"""
     
-    def __init__(self, headless=False, slow_mo=0, enable_cache=True, enable_auto_discovery=True, debug=False, debug_html_mode=False):
+    def __init__(self, headless=False, slow_mo=0, enable_cache=True, enable_auto_discovery=True, debug=False, debug_html_mode=False, batch_mode=False):
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(
             headless=headless,
@@ -30,6 +85,7 @@ class EnhancedTestAutomation:
         )
         self.page = self.browser.new_page()
         self.page.set_default_timeout(30000)
+        self.page.add_init_script(script=_VERIFY_INIT_JS)
         
         # Initialize Anthropic client
         api_key = os.getenv('ANTHROPIC_API_KEY')
@@ -46,10 +102,16 @@ class EnhancedTestAutomation:
         
         self.debug = debug
         self.debug_html_mode = debug_html_mode
+        # Parse multi-file runs through the Message Batches API (half the cost, results take longer)
+        self.batch_mode = batch_mode
+        self._parse_cache = self._load_parse_cache()
         
         # Initialize HTML debug folder if enabled
+        self._debug_executor = None
         if self.debug_html_mode:
             self._create_html_debug_folder()
+            # Debug artifacts are written to disk off the main thread so they don't delay the next step
+            self._debug_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
         
         # Performance tracking
         self.test_performance = {
@@ -65,11 +127,139 @@ class EnhancedTestAutomation:
         if not test_steps:
             return []
         
-        # Create prompt for LLM to parse all steps at once
-        prompt = f"""You are a BDD test step parser. Parse the following test steps into structured actions.
+        cached_actions = self._get_cached_parse(test_steps)
+        if cached_actions is not None:
+            print("Using cached parse of unchanged test steps")
+            return cached_actions
+        
+        try:
+            # Parse all steps at once
+            message = self.anthropic.messages.create(**self._parse_request_params(test_steps))
+            response_text = message.content[0].text.strip()
+            return self._decode_parsed_actions(test_steps, response_text)
+            
+        except Exception as e:
+            print(f"Error parsing steps with LLM: {e}")
+            print(f"LLM Response: {response_text if 'response_text' in locals() else 'No response'}")
+            return []
+    
+    async def parse_all_steps_with_llm_async(self, test_steps, client):
+        """Async version of parse_all_steps_with_llm using the given AsyncAnthropic client"""
+        if not test_steps:
+            return []
+        
+        cached_actions = self._get_cached_parse(test_steps)
+        if cached_actions is not None:
+            return cached_actions
+        
+        try:
+            message = await client.messages.create(**self._parse_request_params(test_steps))
+            response_text = message.content[0].text.strip()
+            return self._decode_parsed_actions(test_steps, response_text)
+            
+        except Exception as e:
+            print(f"Error parsing steps with LLM: {e}")
+            print(f"LLM Response: {response_text if 'response_text' in locals() else 'No response'}")
+            return []
+    
+    def parse_steps_batch(self, all_steps, poll_interval=20):
+        """Parse the steps of several test files in one Message Batches API request"""
+        requests = [
+            {
+                "custom_id": f"test-{i}",
+                "params": self._parse_request_params(test_steps)
+            }
+            for i, test_steps in enumerate(all_steps)
+            if test_steps and self._get_cached_parse(test_steps) is None
+        ]
+        all_parsed_actions = [self._get_cached_parse(test_steps) or [] for test_steps in all_steps]
+        if not requests:
+            return all_parsed_actions
+        
+        try:
+            batch = self.anthropic.messages.batches.create(requests=requests)
+            print(f"Submitted parse batch {batch.id} ({len(requests)} test files)")
+            
+            while batch.processing_status != 'ended':
+                time.sleep(poll_interval)
+                batch = self.anthropic.messages.batches.retrieve(batch.id)
+            
+            # Results come back in any order; custom_id maps them to their test file
+            for entry in self.anthropic.messages.batches.results(batch.id):
+                index = int(entry.custom_id.split('-')[1])
+                if entry.result.type != 'succeeded':
+                    print(f"Error parsing steps for test {index + 1} in batch: {entry.result.type}")
+                    continue
+                
+                response_text = entry.result.message.content[0].text.strip()
+                try:
+                    all_parsed_actions[index] = self._decode_parsed_actions(all_steps[index], response_text)
+                except Exception as e:
+                    print(f"Error parsing steps with LLM: {e}")
+                    print(f"LLM Response: {response_text}")
+                    
+        except Exception as e:
+            print(f"Error parsing steps with LLM batch: {e}")
+        
+        return all_parsed_actions
+    
+    def _parse_request_params(self, test_steps):
+        """Messages API parameters for parsing a test file's steps"""
+        return {
+            "model": PARSE_MODEL,
+            "max_tokens": 2000,
+            "messages": [{"role": "user", "content": self._build_parse_prompt(test_steps)}]
+        }
+    
+    def _decode_parsed_actions(self, test_steps, response_text):
+        """Decode the LLM's JSON response into action tuples and cache them"""
+        # Convert lists to tuples for consistency with original format
+        parsed_actions = [tuple(action) for action in _json_loads(response_text)]
+        self._store_parsed_steps(test_steps, parsed_actions)
+        return parsed_actions
+    
+    def _load_parse_cache(self):
+        """Load cached LLM parse results from disk"""
+        try:
+            with open(PARSE_CACHE_FILE, 'r') as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Warning: Failed to load parse cache: {e}")
+            return {}
+    
+    def _parse_cache_key(self, test_steps):
+        """Cache key for a list of test steps - changes with the steps, the model or the parse prompt"""
+        # The prompt built for no steps is the template, so editing it invalidates earlier parses
+        template_hash = hashlib.sha256(self._build_parse_prompt([]).encode()).hexdigest()
+        return hashlib.sha256("\n".join([PARSE_MODEL, template_hash, *test_steps]).encode()).hexdigest()
+    
+    def _get_cached_parse(self, test_steps):
+        """Cached parsed actions for these test steps, or None"""
+        parsed_actions = self._parse_cache.get(self._parse_cache_key(test_steps))
+        if parsed_actions is None:
+            return None
+        return [tuple(action) for action in parsed_actions]
+    
+    def _store_parsed_steps(self, test_steps, parsed_actions):
+        """Cache parsed actions and write the cache file atomically (temp file + rename)"""
+        self._parse_cache[self._parse_cache_key(test_steps)] = parsed_actions
+        try:
+            cache_dir = os.path.dirname(PARSE_CACHE_FILE)
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=cache_dir, suffix='.tmp', delete=False) as f:
+                json.dump(self._parse_cache, f)
+            os.replace(f.name, PARSE_CACHE_FILE)
+        except Exception as e:
+            print(f"Warning: Failed to save parse cache: {e}")
+    
+    def _build_parse_prompt(self, test_steps):
+        """Build the LLM prompt that parses all steps at once"""
+        return f"""You are a BDD test step parser. Parse the following test steps into structured actions.
 
 For each step, return a tuple with the action type and parameters:
-- navigate: ("navigate", "url")
+- navigate: ("navigate", "url"), or ("navigate", "url", "networkidle") if the step asks to wait for the page to fully load
 - fill: ("fill", "value", "field_description") 
 - click: ("click", "element_description")
 - click_excluding: ("click_excluding", "target_text", "exclusion_text") - for clicks with exclusions like "click X but not Y"
@@ -95,26 +285,6 @@ Return only a valid JSON array of tuples, no other text. Example format:
 ]
 
 Parse the steps above:"""
-
-        try:
-            message = self.anthropic.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            response_text = message.content[0].text.strip()
-            
-            # Parse the JSON response
-            parsed_actions = json.loads(response_text)
-            
-            # Convert lists to tuples for consistency with original format
-            return [tuple(action) for action in parsed_actions]
-            
-        except Exception as e:
-            print(f"Error parsing steps with LLM: {e}")
-            print(f"LLM Response: {response_text if 'response_text' in locals() else 'No response'}")
-            return []
     
     def find_element(self, description):
         """
@@ -123,7 +293,7 @@ Parse the steps above:"""
         This replaces the original 400-line find_element method with a
         high-performance, modular system.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.test_performance['total_element_searches'] += 1
         
         if self.debug:
@@ -137,7 +307,7 @@ Parse the steps above:"""
             retry_attempts=5
         )
         
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
         self.test_performance['total_search_time'] += search_time
         
         if element:
@@ -156,7 +326,7 @@ Parse the steps above:"""
         This method finds elements using hybrid approach then filters out
         elements that contain the exclusion text.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.test_performance['total_element_searches'] += 1
         
         if self.debug:
@@ -171,7 +341,7 @@ Parse the steps above:"""
             retry_attempts=5
         )
         
-        search_time = time.time() - start_time
+        search_time = time.perf_counter() - start_time
         self.test_performance['total_search_time'] += search_time
         
         if element:
@@ -185,7 +355,7 @@ Parse the steps above:"""
     
     def execute_step(self, parsed_action, step_number=None):
         """Execute a single parsed action with enhanced element finding"""
-        step_start_time = time.time()
+        step_start_time = time.perf_counter()
         self.test_performance['total_steps'] += 1
         
         if not parsed_action:
@@ -197,10 +367,13 @@ Parse the steps above:"""
         try:
             if action == 'navigate':
                 url = parsed_action[1]
+                # Optional wait mode - 'networkidle' waits for network to settle (adds >=500ms)
+                wait_mode = parsed_action[2] if len(parsed_action) > 2 else 'domcontentloaded'
                 print(f"Navigating to: {url}")
-                self.page.goto(url)
-                # Wait for page to load
-                self.page.wait_for_load_state('networkidle')
+                # Element lookups auto-wait, so the DOM being ready is enough by default
+                self.page.goto(url, wait_until='domcontentloaded')
+                if wait_mode == 'networkidle':
+                    self.page.wait_for_load_state('networkidle')
                 self.test_performance['successful_steps'] += 1
                 
                 # Capture HTML debug if enabled
@@ -255,27 +428,26 @@ Parse the steps above:"""
                     # Enhanced click with better error handling
                     try:
                         # Check if element is visible and enabled
-                        is_visible = element.is_visible()
-                        is_enabled = not element.get_attribute('disabled')
+                        state = element.evaluate(_CLICK_STATE_JS)
+                        is_visible, is_enabled = state['visible'], not state['disabled']
                         
                         if self.debug:
                             print(f"  → Element state: visible={is_visible}, enabled={is_enabled}")
                         
                         if not is_enabled:
                             print(f"  → Element is disabled, waiting for it to be enabled...")
-                            # Wait up to 10 seconds for element to become enabled
-                            start_wait = time.time()
-                            while time.time() - start_wait < 10:
-                                if not element.get_attribute('disabled'):
-                                    break
-                                time.sleep(0.5)
+                            # Wait up to 10 seconds for element to become enabled; Playwright
+                            # resolves as soon as the state changes instead of polling from here
+                            try:
+                                element.wait_for_element_state('enabled', timeout=10000)
+                            except PlaywrightTimeoutError:
+                                print(f"  → Element still disabled after 10s, clicking anyway")
                         
                         element.click()
                         print(f"  → Clicked successfully!")
                         
                         # Wait for any navigation or updates
                         try:
-                            time.sleep(0.5)
                             self.page.wait_for_load_state('domcontentloaded', timeout=10000)
                         except Exception as nav_error:
                             if self.debug:
@@ -321,73 +493,37 @@ Parse the steps above:"""
                 print(f"Verifying '{text_to_verify}' is displayed")
                 
                 # Enhanced verification with multiple strategies
-                max_retries = 8
                 wait_times = [0.5, 1, 1.5, 2, 3, 4, 5, 7]
                 
-                for attempt in range(max_retries):
-                    print(f"  → Verification attempt {attempt + 1}/{max_retries}")
-                    
+                # Cheap pre-check: title, URL and body text as they are right now
+                found = self._text_in_page_sources(text_to_verify)
+                
+                if not found:
+                    # Wait for a visible element containing the text with the whole budget in one
+                    # call - Playwright returns as soon as it appears instead of at the next retry.
+                    # Hidden copies (e.g. a collapsed mobile nav) are filtered out before taking the first
                     try:
-                        # Wait for page stability
-                        self.page.wait_for_load_state('domcontentloaded', timeout=3000)
-                        
-                        current_url = self.page.url
-                        page_title = self.page.title()
-                        page_content = self.page.content()
-                        
-                        # Check multiple sources
-                        if (text_to_verify.lower() in page_title.lower() or 
-                            text_to_verify.lower() in current_url.lower() or
-                            text_to_verify.lower() in page_content.lower()):
-                            print(f"✓ '{text_to_verify}' found on page")
-                            self.test_performance['successful_steps'] += 1
-                            
-                            # Capture HTML debug if enabled
-                            if step_number is not None:
-                                self._capture_html_debug(step_number, action, text_to_verify)
-                            
-                            return True
-                        
-                        # Check visible text elements
-                        visible_text = self.page.evaluate('''() => {
-                            return new Promise(resolve => {
-                                setTimeout(() => {
-                                    const text = Array.from(document.querySelectorAll('*'))
-                                        .filter(el => {
-                                            const style = window.getComputedStyle(el);
-                                            return el.offsetParent !== null && 
-                                                   el.textContent.trim() &&
-                                                   style.visibility !== 'hidden' &&
-                                                   style.display !== 'none';
-                                        })
-                                        .map(el => el.textContent.trim())
-                                        .join(' ');
-                                    resolve(text);
-                                }, 100);
-                            });
-                        }''')
-                        
-                        if text_to_verify.lower() in visible_text.lower():
-                            print(f"✓ '{text_to_verify}' found in visible text")
-                            self.test_performance['successful_steps'] += 1
-                            
-                            # Capture HTML debug if enabled
-                            if step_number is not None:
-                                self._capture_html_debug(step_number, action, text_to_verify)
-                            
-                            return True
-                            
-                    except Exception as e:
-                        print(f"  → Verification attempt {attempt + 1} failed: {e}")
-                    
-                    if attempt < max_retries - 1:
-                        wait_time = wait_times[attempt]
-                        print(f"  → Text not found yet, waiting {wait_time}s...")
-                        time.sleep(wait_time)
+                        visible_text = self.page.get_by_text(text_to_verify, exact=False).locator('visible=true')
+                        expect(visible_text.first).to_be_visible(timeout=sum(wait_times) * 1000)
+                        print(f"✓ '{text_to_verify}' found in visible text")
+                        found = True
+                    except AssertionError:
+                        # A redirect may have arrived while waiting (e.g. to /dashboard), so
+                        # check title and URL again before failing the step
+                        found = self._text_in_page_sources(text_to_verify)
                 
-                print(f"✗ '{text_to_verify}' not found on page after {max_retries} attempts")
-                self._record_failed_step(action, text_to_verify)
-                return False
+                if not found:
+                    print(f"✗ '{text_to_verify}' not found on page after {sum(wait_times):g}s")
+                    self._record_failed_step(action, text_to_verify)
+                    return False
+                
+                self.test_performance['successful_steps'] += 1
+                
+                # Capture HTML debug if enabled
+                if step_number is not None:
+                    self._capture_html_debug(step_number, action, text_to_verify)
+                
+                return True
             
             else:
                 print(f"Unknown action: {action}")
@@ -399,6 +535,29 @@ Parse the steps above:"""
             self._record_failed_step(action, str(parsed_action), str(e))
             return False
     
+    def _text_in_page_sources(self, text_to_verify):
+        """Check the page title, URL and body text for the text (case-insensitive)"""
+        needle = text_to_verify.lower()
+        try:
+            # Wait for page stability
+            self.page.wait_for_load_state('domcontentloaded', timeout=3000)
+            
+            current_url = self.page.url
+            page_title = self.page.title()
+            # Search the body text in-page so only a boolean crosses CDP,
+            # not the serialized DOM
+            found_in_body = self.page.evaluate(_BODY_TEXT_INCLUDES_JS, needle)
+            
+            # Check multiple sources
+            if (needle in page_title.lower() or 
+                needle in current_url.lower() or
+                found_in_body):
+                print(f"✓ '{text_to_verify}' found on page")
+                return True
+        except Exception as e:
+            print(f"  → Verification page check failed: {e}")
+        return False
+    
     def _create_html_debug_folder(self):
         """Create the html_debug folder for storing HTML snapshots"""
         self.html_debug_folder = os.path.join(os.getcwd(), 'html_debug')
@@ -417,20 +576,19 @@ Parse the steps above:"""
         
         try:
             timestamp = int(time.time())
-            safe_description = "".join(c for c in description if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_description = safe_description.replace(' ', '_')[:50]
+            safe_description = _SAFE_RE.sub('', description).rstrip().replace(' ', '_')[:50]
             
             base_filename = f"step_{step_number:02d}_{action}_{safe_description}_{timestamp}"
-            html_file = os.path.join(self.html_debug_folder, f"{base_filename}.html")
-            screenshot_file = os.path.join(self.html_debug_folder, f"{base_filename}.png")
+            html_file = os.path.join(self.html_debug_folder, f"{base_filename}.html.gz")
+            screenshot_file = os.path.join(self.html_debug_folder, f"{base_filename}.jpg")
             
-            # Save HTML content
+            # Page access must stay on this thread (sync Playwright); only the file writes are offloaded
             html_content = self.page.content()
-            with open(html_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            # Save screenshot
-            self.page.screenshot(path=screenshot_file)
+            # Compress and write the HTML while the browser encodes the screenshot
+            self._debug_executor.submit(_write_debug_html, html_file, html_content)
+            # JPEG at quality 60 is plenty for debugging and far cheaper to encode/store than PNG
+            screenshot_bytes = self.page.screenshot(type='jpeg', quality=60, full_page=False)
+            self._debug_executor.submit(_write_debug_screenshot, screenshot_file, screenshot_bytes)
             
             if self.debug:
                 print(f"📄 HTML debug saved: {base_filename}")
@@ -447,15 +605,42 @@ Parse the steps above:"""
             'timestamp': time.time()
         })
     
-    def run_test(self, test_steps):
+    def run_tests(self, test_files):
+        """Run several test files, parsing all of them with the LLM concurrently up front"""
+        all_steps = [self.load_test_steps(test_file) for test_file in test_files]
+        
+        async def parse_all():
+            # The client's connection pool is bound to this event loop, so it only lives as long as the loop
+            async with AsyncAnthropic(api_key=self.anthropic.api_key) as client:
+                return await asyncio.gather(*(self.parse_all_steps_with_llm_async(steps, client) for steps in all_steps))
+        
+        print(f"Parsing {len(test_files)} test files with LLM...")
+        if self.batch_mode:
+            all_parsed_actions = self.parse_steps_batch(all_steps)
+        else:
+            # The sync Playwright API keeps its own event loop on this thread, so the
+            # parse loop runs on a worker thread
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                all_parsed_actions = executor.submit(asyncio.run, parse_all()).result()
+        
+        # Execution shares one browser, so the tests themselves run one after another
+        for test_file, test_steps, parsed_actions in zip(test_files, all_steps, all_parsed_actions):
+            print(f"\n📄 {test_file}")
+            if not test_steps:
+                print("No test steps found. Skipping.")
+                continue
+            self.run_test(test_steps, parsed_actions)
+    
+    def run_test(self, test_steps, parsed_actions=None):
         """Run a complete test scenario with enhanced performance tracking"""
         print("🚀 Starting enhanced test execution...\n")
         
-        test_start_time = time.time()
+        test_start_time = time.perf_counter()
         
-        # Parse all steps with LLM upfront
-        print("Parsing test steps with LLM...")
-        parsed_actions = self.parse_all_steps_with_llm(test_steps)
+        # Parse all steps with LLM upfront (unless run_tests already did)
+        if parsed_actions is None:
+            print("Parsing test steps with LLM...")
+            parsed_actions = self.parse_all_steps_with_llm(test_steps)
         
         if not parsed_actions:
             print("Failed to parse test steps. Exiting.")
@@ -471,9 +656,9 @@ Parse the steps above:"""
             print(f"Step {i}: {step}")
             print(f"  → Parsed as: {parsed_action}")
             
-            step_start = time.time()
+            step_start = time.perf_counter()
             success = self.execute_step(parsed_action, step_number=i)
-            step_duration = time.time() - step_start
+            step_duration = time.perf_counter() - step_start
             
             if success:
                 print(f"  ✓ Completed in {step_duration:.2f}s")
@@ -484,7 +669,7 @@ Parse the steps above:"""
             print()
         
         # Print performance summary
-        total_test_time = time.time() - test_start_time
+        total_test_time = time.perf_counter() - test_start_time
         self._print_performance_summary(total_test_time)
         
         print("🎯 Enhanced test execution completed!")
@@ -549,22 +734,21 @@ Parse the steps above:"""
         except Exception as e:
             print(f"Error generating final stats: {e}")
         finally:
+            # Let pending debug artifact writes finish
+            if self._debug_executor:
+                self._debug_executor.shutdown(wait=True)
             self.browser.close()
             self.playwright.stop()
     
     def load_test_steps(self, file_path):
         """Load test steps from external file"""
-        test_steps = []
         try:
             with open(file_path, 'r') as file:
-                for line in file:
-                    line = line.strip()
-                    if line:  # Skip empty lines
-                        test_steps.append(line)
+                # Skip empty lines
+                return [line for line in map(str.strip, file) if line]
         except FileNotFoundError:
             print(f"Test file not found: {file_path}")
             return []
-        return test_steps
 
 
 # Example usage and comparison
@@ -572,18 +756,22 @@ if __name__ == "__main__":
     import os
     import sys
     
-    # Check if test filename was provided as command line argument
-    if len(sys.argv) < 2:
-        print("Usage: python enhanced_test_automation.py <test_filename> [--debug] [--debug-html]")
+    # Check if test filename(s) were provided as command line arguments
+    test_filenames = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not test_filenames:
+        print("Usage: python enhanced_test_automation.py <test_filename> [<test_filename> ...] [--debug] [--debug-html] [--batch]")
         print("Example: python enhanced_test_automation.py feature1.test --debug --debug-html")
+        print("Example: python enhanced_test_automation.py feature1.test feature2.test --batch")
         sys.exit(1)
     
-    test_filename = sys.argv[1]
     debug_mode = '--debug' in sys.argv
     
     # Check for debug HTML mode
     debug_html_mode = '--debug-html' in sys.argv
     
+    # Parse multiple test files through the Message Batches API
+    batch_mode = '--batch' in sys.argv
+    
     # Load test steps from external file
     automation = EnhancedTestAutomation(
         headless=False, 
@@ -591,23 +779,28 @@ if __name__ == "__main__":
         enable_cache=True,
         enable_auto_discovery=True,
         debug=debug_mode,
-        debug_html_mode=debug_html_mode
+        debug_html_mode=debug_html_mode,
+        batch_mode=batch_mode
     )
     
-    # Get test file path relative to script location
+    # Get test file paths relative to script location
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    test_file = os.path.join(script_dir, '..', 'tests', test_filename)
-    
-    test_steps = automation.load_test_steps(test_file)
+    test_files = [os.path.join(script_dir, '..', 'tests', test_filename) for test_filename in test_filenames]
     
-    if not test_steps:
-        print("No test steps found. Exiting.")
-        automation.cleanup()
-        exit(1)
+    if len(test_files) == 1:
+        test_steps = automation.load_test_steps(test_files[0])
+        
+        if not test_steps:
+            print("No test steps found. Exiting.")
+            automation.cleanup()
+            exit(1)
     
-    # Run the enhanced test
+    # Run the enhanced test (several files are parsed up front, concurrently or as one batch)
     try:
-        automation.run_test(test_steps)
+        if len(test_files) == 1:
+            automation.run_test(test_steps)
+        else:
+            automation.run_tests(test_files)
     except Exception as e:
         print(f"\nTest failed with error: {e}")
         print("Taking final screenshot...")
@@ -0,0 +1,69 @@
+"""
+Checks that the batched text similarity paths (pure Python, numpy, numba) agree
+exactly with the scalar calculate_text_similarity. No browser is needed.
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from element_finder import base
+from element_finder.strategies import GenericStrategy
+
+
+# (key words, candidate texts) pairs covering exact, containment, overlap and no-match cases
+_CASES = [
+    # Empty texts on either side
+    ('', ['', 'save', '   ']),
+    ('save', ['', '   ']),
+    # Exact matches after lowercasing/stripping
+    ('Save', ['save', 'SAVE', '  Save  ', '\tsave\n']),
+    # Containment both ways
+    ('save', ['save as', 'autosave', 'sa', 's']),
+    ('save as draft', ['save', 'as', 'draft', 'save as']),
+    # Word overlap, including repeated words on either side
+    ('save changes', ['changes saved', 'save save save', 'discard changes changes', 'the save changes button']),
+    ('save the the file', ['the file the file', 'file save', 'open file file']),
+    # No overlap at all
+    ('login', ['cancel', 'log out', 'sign in']),
+    # Texts that get longer when lowercased ('İ' becomes 'i' plus a combining dot)
+    ('i̇stanbul', ['İSTANBUL', 'İSTANBUL CITY', 'GO TO İSTANBUL NOW']),
+    ('İstanbul', ['i̇stanbul', 'İSTANBUL']),
+    # Whitespace other than plain spaces, as found in textContent
+    ('save changes', ['save changes', 'save\nchanges', 'changes\tsave now', '\xa0save\xa0changes\xa0']),
+]
+
+
+class TextSimilarityPathsTest(unittest.TestCase):
+    """calculate_text_similarities must match calculate_text_similarity on every path"""
+
+    def setUp(self):
+        self.strategy = GenericStrategy()
+
+    def assert_matches_scalar(self, numpy_available: bool, numba_available: bool):
+        """Compare the batched scores against the scalar ones with the given optional paths enabled"""
+        with mock.patch.object(base, '_NUMPY_AVAILABLE', numpy_available), \
+                mock.patch.object(base, '_NUMBA_AVAILABLE', numba_available):
+            for key_words, texts in _CASES:
+                with self.subTest(key_words=key_words, texts=texts):
+                    expected = [self.strategy.calculate_text_similarity(key_words, text) for text in texts]
+                    self.assertEqual(self.strategy.calculate_text_similarities(key_words, texts), expected)
+            self.assertEqual(self.strategy.calculate_text_similarities('save', []), [])
+
+    def test_pure_python(self):
+        self.assert_matches_scalar(numpy_available=False, numba_available=False)
+
+    @unittest.skipUnless(base._NUMPY_AVAILABLE, "numpy is not installed")
+    def test_numpy(self):
+        self.assert_matches_scalar(numpy_available=True, numba_available=False)
+
+    @unittest.skipUnless(base._NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba(self):
+        self.assert_matches_scalar(numpy_available=True, numba_available=True)
+
+
+if __name__ == '__main__':
+    unittest.main()